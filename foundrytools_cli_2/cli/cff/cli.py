@@ -91,6 +91,23 @@ def del_names(input_path: Path, **options: t.Dict[str, t.Any]) -> None:
     runner.run()
 
 
+def _get_cff_names_snapshot(font: Font) -> t.Tuple[t.List[str], t.Dict[str, t.Any]]:
+    """
+    Returns a snapshot of the ``CFF`` font names and of all the ``TopDict`` fields, so that the font
+    is saved only if ``find-replace`` changed any of them.
+
+    Fields that were set or already decompiled are read from the ``TopDict`` instance, the other
+    ones from its ``rawDict``, so that taking the snapshot doesn't decompile anything. A field that
+    is decompiled between two snapshots can at worst make an unchanged font be saved.
+    """
+    cff = font.t_cff_.table.cff
+    top_dict = font.t_cff_.top_dict
+    values = vars(top_dict)
+    return list(cff.fontNames), {
+        name: values.get(name, top_dict.rawDict.get(name)) for name in top_dict.order
+    }
+
+
 @cli.command("find-replace", cls=BaseCommand)
 @click.option(
     "-os",
@@ -119,8 +136,9 @@ def find_replace(input_path: Path, **options: t.Dict[str, t.Any]) -> None:
     """
 
     def task(font: Font, old_string: str, new_string: str) -> bool:
+        names_before = _get_cff_names_snapshot(font)
         font.t_cff_.find_replace(old_string, new_string)
-        return True
+        return _get_cff_names_snapshot(font) != names_before
 
     runner = TaskRunner(input_path=input_path, task=task, **options)
     runner.filter.filter_out_tt = True
@@ -7,7 +7,9 @@ import click
 from foundrytools import Font
 
 from foundrytools_cli_2.cli.base_command import BaseCommand
+from foundrytools_cli_2.cli.logger import logger
 from foundrytools_cli_2.cli.shared_callbacks import choice_to_int_callback
+from foundrytools_cli_2.cli.shared_options import jobs_option
 from foundrytools_cli_2.cli.task_runner import TaskRunner
 
 cli = click.Group("converter", help="Font conversion utilities.")
@@ -35,6 +37,7 @@ cli = click.Group("converter", help="Font conversion utilities.")
     (which in some cases can lead to corrupted outlines).
     """,
 )
+@jobs_option()
 def otf_to_ttf(input_path: Path, **options: dict[str, Any]) -> None:
     """
     Convert PostScript flavored fonts to TrueType flavored fonts.
@@ -112,6 +115,7 @@ def otf_to_ttf(input_path: Path, **options: dict[str, Any]) -> None:
     show_default=True,
     help="Subroutinize the font with ``cffsubr`` after conversion.",
 )
+@jobs_option()
 def ttf_to_otf(input_path: Path, **options: dict[str, Any]) -> None:
     """
     Convert TrueType flavored fonts to PostScript flavored fonts.
@@ -120,6 +124,10 @@ def ttf_to_otf(input_path: Path, **options: dict[str, Any]) -> None:
 
     if options["mode"] == "tx":
         options.pop("tolerance")
+        # sfntedit uses a fixed temporary file, so fonts can't be converted in parallel with tx
+        if options["jobs"] != 1:
+            logger.warning("The tx mode doesn't support parallel processing, using 1 job")
+            options["jobs"] = 1  # type: ignore
         task = ttf2otf_with_tx
     else:
         task = ttf2otf  # type: ignore
@@ -134,8 +134,6 @@ def ttf2otf_with_tx(
         font.scale_upm(target_upm=target_upm)
         font.ttfont.save(out_file, reorderTables=None)
         font = Font(out_file, recalc_timestamp=recalc_timestamp)
-        tx_command = ["tx", "-cff", "-S", "+V", "+b", str(out_file), str(cff_file)]
-        run_shell_command(tx_command, suppress_output=True)
 
     logger.info("Dumping the CFF table...")
     tx_command = ["tx", "-cff", "-S", "+V", "+b", str(font.file), str(cff_file)]
@@ -13,7 +13,7 @@ from foundrytools_cli_2.cli.fix.options import (
     min_area_option,
 )
 from foundrytools_cli_2.cli.logger import logger
-from foundrytools_cli_2.cli.shared_options import base_options
+from foundrytools_cli_2.cli.shared_options import base_options, jobs_option
 from foundrytools_cli_2.cli.task_runner import TaskRunner
 
 cli = click.Group(help="Fix font errors.")
@@ -24,6 +24,7 @@ cli = click.Group(help="Fix font errors.")
 @keep_hinting_flag()
 @ignore_errors_flag()
 @keep_unused_subroutines_flag()
+@jobs_option()
 @base_options()
 def fix_contours(input_path: Path, **options: t.Dict[str, t.Any]) -> None:
     """
@@ -36,30 +37,7 @@ def fix_contours(input_path: Path, **options: t.Dict[str, t.Any]) -> None:
     * Correct the direction of the contours.
     * Remove tiny paths.
     """
-
-    def task(
-        font: Font,
-        min_area: int = 25,
-        remove_hinting: bool = True,
-        ignore_errors: bool = False,
-        remove_unused_subroutines: bool = True,
-    ) -> bool:
-        logger.info("Correcting contours...")
-        modified_glyphs = font.correct_contours(
-            min_area=min_area,
-            remove_hinting=remove_hinting,
-            ignore_errors=ignore_errors,
-            remove_unused_subroutines=remove_unused_subroutines,
-        )
-
-        if not modified_glyphs:
-            logger.info("No glyphs were modified")
-            return False
-
-        logger.opt(colors=True).info(
-            f"{len(modified_glyphs)} glyphs were modified: <lc>{', '.join(modified_glyphs)}</lc>"
-        )
-        return True
+    from foundrytools_cli_2.cli.fix.tasks.contours import main as task
 
     runner = TaskRunner(input_path=input_path, task=task, **options)
     runner.filter.filter_out_variable = True
@@ -494,20 +472,21 @@ def fix_vertical_metrics(input_path: Path, **options: t.Dict[str, t.Any]) -> Non
     """
     from foundrytools import FontFinder
 
-    fonts = FontFinder(input_path).find_fonts()
-    if not fonts:
+    # Calculate the minimum y_min and maximum y_max values while scanning the fonts, so that each
+    # font can be closed as soon as its bounds are read.
+    y_min: t.Optional[float] = None
+    y_max: t.Optional[float] = None
+    for font in FontFinder(input_path).generate_fonts():
+        with font:
+            font_y_min, font_y_max = font.t_head.y_min, font.t_head.y_max
+        y_min = font_y_min if y_min is None else min(y_min, font_y_min)
+        y_max = font_y_max if y_max is None else max(y_max, font_y_max)
+
+    if y_min is None or y_max is None:
         raise click.ClickException("No fonts found.")
 
-    metrics = []
-    for font in fonts:
-        metrics.append((font.t_head.y_min, font.t_head.y_max))
-
-    # Calculate the minimum y_min and maximum y_max values
-    safe_bottom = otRound(min(m[0] for m in metrics))
-    safe_top = otRound(max(m[1] for m in metrics))
-
-    options["safe_bottom"] = t.cast(t.Any, safe_bottom)
-    options["safe_top"] = t.cast(t.Any, safe_top)
+    options["safe_bottom"] = t.cast(t.Any, otRound(y_min))
+    options["safe_top"] = t.cast(t.Any, otRound(y_max))
 
     from foundrytools_cli_2.cli.fix.tasks.vertical_metrics import main as task
 
@@ -0,0 +1,42 @@
+from foundrytools import Font
+
+from foundrytools_cli_2.cli.logger import logger
+
+
+def main(
+    font: Font,
+    min_area: int = 25,
+    remove_hinting: bool = True,
+    ignore_errors: bool = False,
+    remove_unused_subroutines: bool = True,
+) -> bool:
+    """
+    Correct the contours of a font by removing overlaps, correcting the direction of the contours,
+    and removing tiny paths.
+
+    Args:
+        font (Font): The font to fix.
+        min_area (int, optional): The minimum area of a path to be kept. Defaults to 25.
+        remove_hinting (bool, optional): Whether to remove the hinting of TrueType fonts. Defaults
+            to ``True``.
+        ignore_errors (bool, optional): Whether to keep the tricky glyphs unchanged instead of
+            raising an error. Defaults to ``False``.
+        remove_unused_subroutines (bool, optional): Whether to remove the unused subroutines from
+            the ``CFF`` table. Defaults to ``True``.
+    """
+    logger.info("Correcting contours...")
+    modified_glyphs = font.correct_contours(
+        min_area=min_area,
+        remove_hinting=remove_hinting,
+        ignore_errors=ignore_errors,
+        remove_unused_subroutines=remove_unused_subroutines,
+    )
+
+    if not modified_glyphs:
+        logger.info("No glyphs were modified")
+        return False
+
+    logger.opt(colors=True).info(
+        f"{len(modified_glyphs)} glyphs were modified: <lc>{', '.join(modified_glyphs)}</lc>"
+    )
+    return True
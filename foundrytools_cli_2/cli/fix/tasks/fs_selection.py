@@ -10,13 +10,18 @@ def main(font: Font) -> bool:
         font (Font): The font to fix.
     """
 
+    # Each flag reads the OS/2 and head bits, so read them once.
+    flags = font.flags
+    is_bold_or_italic = flags.is_bold or flags.is_italic
+    is_regular = flags.is_regular
+
     # If the font is not bold or italic, set it to regular
-    if not (font.flags.is_bold or font.flags.is_italic or font.flags.is_regular):
-        font.flags.set_regular()
+    if not (is_bold_or_italic or is_regular):
+        flags.set_regular()
         return True
 
     # If the font is bold or italic, set it to not regular
-    if (font.flags.is_bold or font.flags.is_italic) and font.flags.is_regular:
+    if is_bold_or_italic and is_regular:
         font.t_os_2.fs_selection.regular = False
         return True
 
@@ -1,6 +1,5 @@
 from foundrytools import Font
 from foundrytools.constants import T_CMAP, T_GDEF, T_HMTX
-from foundrytools.core.tables import GdefTable
 
 from foundrytools_cli_2.cli.logger import logger
 
@@ -28,9 +27,16 @@ def fix_legacy_accents(font: Font) -> bool:
     reverse_cmap = font.ttfont[T_CMAP].buildReversed()
     hmtx = font.ttfont[T_HMTX]
 
+    # Names of the glyphs mapped to at least one legacy accent code-point.
+    legacy_accent_names = [
+        name
+        for name, codepoints in reverse_cmap.items()
+        if not codepoints.isdisjoint(legacy_accents)
+    ]
+
     # Check whether legacy accents have positive width. Just print a warning if they don't.
-    for name in reverse_cmap:
-        if reverse_cmap[name].intersection(legacy_accents) and hmtx[name][0] == 0:
+    for name in legacy_accent_names:
+        if hmtx[name][0] == 0:
             logger.warning(
                 f'Width of legacy accent "{name}" is zero; should be positive.',
             )
@@ -38,18 +44,12 @@ def fix_legacy_accents(font: Font) -> bool:
     # Check whether legacy accents appear in GDEF as marks.
     # Not being marks in GDEF also typically means that they don't have anchors, as font compilers
     # would have otherwise classified them as marks in GDEF.
-    if T_GDEF in font.ttfont and font.ttfont[T_GDEF].table.GlyphClassDef:
-        deleted = set()
-        gdef = GdefTable(ttfont=font.ttfont)
-        class_defs = gdef.table.table.GlyphClassDef.classDefs
-        for name in reverse_cmap:
-            if (
-                reverse_cmap[name].intersection(legacy_accents)
-                and name in class_defs
-                and class_defs[name] == 3
-            ):
-                del class_defs[name]
-                deleted.add(name)
+    glyph_class_def = font.ttfont[T_GDEF].table.GlyphClassDef if T_GDEF in font.ttfont else None
+    if glyph_class_def:
+        class_defs = glyph_class_def.classDefs
+        deleted = [name for name in legacy_accent_names if class_defs.get(name) == 3]
+        for name in deleted:
+            del class_defs[name]
 
         if deleted:
             logger.info(
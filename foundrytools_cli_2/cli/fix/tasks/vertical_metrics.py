@@ -10,18 +10,20 @@ def main(font: Font, safe_bottom: int, safe_top: int) -> bool:
         safe_bottom (int): The safe bottom value for the font's vertical metrics.
         safe_top (int): The safe top value for the font's vertical metrics.
     """
+    os_2 = font.t_os_2
+    hhea = font.t_hhea
 
-    font.t_os_2.win_ascent = safe_top
-    font.t_os_2.win_descent = abs(safe_bottom)
-    font.t_os_2.typo_ascender = safe_top
-    font.t_os_2.typo_descender = safe_bottom
-    font.t_os_2.typo_line_gap = 0
-    font.t_hhea.ascent = safe_top
-    font.t_hhea.descent = safe_bottom
-    font.t_hhea.line_gap = 0
+    os_2.win_ascent = safe_top
+    os_2.win_descent = abs(safe_bottom)
+    os_2.typo_ascender = safe_top
+    os_2.typo_descender = safe_bottom
+    os_2.typo_line_gap = 0
+    hhea.ascent = safe_top
+    hhea.descent = safe_bottom
+    hhea.line_gap = 0
 
     # Set the USE_TYPO_METRICS bit
-    if font.t_os_2.version >= 4:
-        font.t_os_2.fs_selection.use_typo_metrics = True
+    if os_2.version >= 4:
+        os_2.fs_selection.use_typo_metrics = True
 
-    return font.t_os_2.is_modified or font.t_hhea.is_modified
+    return os_2.is_modified or hhea.is_modified
@@ -29,10 +29,9 @@ def rebuild_cmap(input_path: Path, **options: t.Dict[str, t.Any]) -> None:
         remapped_glyphs, _ = font.t_cmap.rebuild_character_map(remap_all=remap_all)
         if remapped_glyphs:
             logger.info("Remapped glyphs:")
-            for r in remapped_glyphs:
-                logger.opt(colors=True).info(
-                    f" {r[1]} -> <lc>{hex(r[0])[:2]}{hex(r[0])[2:].upper().zfill(6)}</lc>"
-                )
+            log_info = logger.opt(colors=True).info
+            for codepoint, glyph_name in remapped_glyphs:
+                log_info(f" {glyph_name} -> <lc>0x{codepoint:06X}</lc>")
             return True
 
         return False
@@ -43,7 +43,12 @@ def rename_feature(input_path: Path, **options: t.Dict[str, t.Any]) -> None:
             logger.warning("Old and new feature tags are the same. No changes made.")
             return False
 
-        if new_feature_name in font.t_gsub.get_feature_tags():
+        feature_tags = font.t_gsub.get_feature_tags()
+        if old_feature_name not in feature_tags:
+            logger.warning(f"Feature tag '{old_feature_name}' not found")
+            return False
+
+        if new_feature_name in feature_tags:
             logger.warning(f"Feature tag '{new_feature_name}' already exists")
             return False
 
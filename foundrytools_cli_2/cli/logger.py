@@ -1,8 +1,12 @@
+import io
 import sys
 from functools import partialmethod
 
 from loguru import logger
 
+LOG_FORMAT = "[ <level>{level: <8}</level> ] {message}"
+LOG_LEVEL = "INFO"
+
 # Remove the default logger
 logger.remove()
 
@@ -11,11 +15,47 @@ logger.add(
     sys.stderr,
     backtrace=False,
     colorize=True,
-    format="[ <level>{level: <8}</level> ] " "{message}",
-    level="INFO",
+    format=LOG_FORMAT,
+    level=LOG_LEVEL,
 )
 
 # Add a custom level to the logger
 logger.level("SKIP", no=27, color="<light-black><bold>", icon="⏭️")
 logger.__class__.skip = partialmethod(logger.__class__.log, "SKIP")  # type: ignore
 logger.opt(colors=True)
+
+
+# Buffer used by the worker processes instead of stderr. See ``init_worker_logger``.
+_WORKER_LOGS = io.StringIO()
+
+
+def init_worker_logger() -> None:
+    """
+    Initialize the logger of a worker process.
+
+    The messages are written to an in-memory buffer instead of ``stderr``, so that the messages
+    logged while processing a font can be sent back to the main process and printed in order,
+    instead of being interleaved with the messages of the other workers. Use it as the
+    ``initializer`` of the process pool, and retrieve the messages with ``pop_worker_logs``.
+    """
+    logger.remove()
+    logger.add(
+        _WORKER_LOGS,
+        backtrace=False,
+        colorize=True,
+        format=LOG_FORMAT,
+        level=LOG_LEVEL,
+    )
+
+
+def pop_worker_logs() -> str:
+    """
+    Return the messages logged by the worker process since the last call, and empty the buffer.
+
+    Returns:
+        str: The logged messages.
+    """
+    logs = _WORKER_LOGS.getvalue()
+    _WORKER_LOGS.seek(0)
+    _WORKER_LOGS.truncate()
+    return logs
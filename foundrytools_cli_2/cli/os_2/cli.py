@@ -19,6 +19,26 @@ from foundrytools_cli_2.cli.task_runner import TaskRunner
 
 cli = click.Group(help="Utilities for editing the ``OS/2`` table.")
 
+# Maps the ``fs-selection`` options to the functions that set the corresponding flags. The italic,
+# bold and regular flags are set through ``Font.flags``, so that the ``macStyle`` bits in the
+# ``head`` table are kept in sync with ``fsSelection``.
+FS_SELECTION_SETTERS: t.Dict[str, t.Callable[[Font, bool], None]] = {
+    "italic": lambda font, value: setattr(font.flags, "is_italic", value),
+    "underscore": lambda font, value: setattr(font.t_os_2.fs_selection, "underscore", value),
+    "negative": lambda font, value: setattr(font.t_os_2.fs_selection, "negative", value),
+    "outline": lambda font, value: setattr(font.t_os_2.fs_selection, "outlined", value),
+    "strikeout": lambda font, value: setattr(font.t_os_2.fs_selection, "strikeout", value),
+    "bold": lambda font, value: setattr(font.flags, "is_bold", value),
+    "regular": lambda font, _: font.flags.set_regular(),
+    "use_typo_metrics": lambda font, value: setattr(
+        font.t_os_2.fs_selection, "use_typo_metrics", value
+    ),
+    "wws_consistent": lambda font, value: setattr(
+        font.t_os_2.fs_selection, "wws_consistent", value
+    ),
+    "oblique": lambda font, value: setattr(font.t_os_2.fs_selection, "oblique", value),
+}
+
 
 @cli.command("recalc-avg-width")
 @base_options()
@@ -144,13 +164,17 @@ def set_attrs(input_path: Path, **options: t.Dict[str, t.Any]) -> None:
     ensure_at_least_one_param(click.get_current_context())
 
     def task(font: Font, **kwargs: t.Dict[str, t.Optional[t.Union[int, float, str, bool]]]) -> bool:
+        # Compiling the table to check if it was modified is only needed if a setter succeeded.
+        os_2 = font.t_os_2
+        attrs_set = False
         for attr, value in kwargs.items():
             if value is not None:
                 try:
-                    setattr(font.t_os_2, attr, value)
+                    setattr(os_2, attr, value)
+                    attrs_set = True
                 except (ValueError, InvalidOS2VersionError) as e:
                     logger.warning(f"Error setting {attr} to {value}: {e}")
-        return font.t_os_2.is_modified
+        return attrs_set and os_2.is_modified
 
     runner = TaskRunner(input_path=input_path, task=task, **options)
     runner.run()
@@ -166,12 +190,14 @@ def set_fs_selection(input_path: Path, **options: t.Dict[str, t.Any]) -> None:
     ensure_at_least_one_param(click.get_current_context())
 
     def task(font: Font, **kwargs: t.Dict[str, t.Optional[bool]]) -> bool:
+        attrs_set = False
         for attr, value in kwargs.items():
-            if value is not None:
-                if hasattr(font.flags, attr):
-                    setattr(font.flags, attr, value)
-                elif hasattr(font.t_os_2.fs_selection, attr):
-                    setattr(font.t_os_2.fs_selection, attr, value)
+            setter = FS_SELECTION_SETTERS.get(attr)
+            if setter is not None and value is not None:
+                setter(font, value)  # type: ignore[arg-type]
+                attrs_set = True
+        if not attrs_set:
+            return False
         # IMPORTANT: 'head' is a dependency of 'OS/2'. If 'font.t_head.is_modified' is evaluated
         # 'font.t_os_2.is_modified' to suppress fontTools warning about non-matching bits.
         return font.t_head.is_modified or font.t_os_2.is_modified
@@ -190,10 +216,13 @@ def set_fs_type(input_path: Path, **options: t.Dict[str, t.Any]) -> None:
     ensure_at_least_one_param(click.get_current_context())
 
     def task(font: Font, **kwargs: t.Dict[str, t.Optional[bool]]) -> bool:
+        os_2 = font.t_os_2
+        attrs_set = False
         for attr, value in kwargs.items():
-            if hasattr(font.t_os_2, attr) and value is not None:
-                setattr(font.t_os_2, attr, value)
-        return font.t_os_2.is_modified
+            if hasattr(os_2, attr) and value is not None:
+                setattr(os_2, attr, value)
+                attrs_set = True
+        return attrs_set and os_2.is_modified
 
     runner = TaskRunner(input_path=input_path, task=task, **options)
     runner.run()
@@ -209,10 +238,14 @@ def set_panose(input_path: Path, **options: t.Dict[str, t.Any]) -> None:
     ensure_at_least_one_param(click.get_current_context())
 
     def task(font: Font, **kwargs: t.Dict[str, int]) -> bool:
+        os_2 = font.t_os_2
+        panose = os_2.table.panose
+        attrs_set = False
         for attr, value in kwargs.items():
-            if hasattr(font.t_os_2.table.panose, attr) and value is not None:
-                setattr(font.t_os_2.table.panose, attr, value)
-        return font.t_os_2.is_modified
+            if hasattr(panose, attr) and value is not None:
+                setattr(panose, attr, value)
+                attrs_set = True
+        return attrs_set and os_2.is_modified
 
     runner = TaskRunner(input_path=input_path, task=task, **options)
     runner.run()
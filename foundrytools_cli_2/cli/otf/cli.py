@@ -12,7 +12,7 @@ from foundrytools.utils.path_tools import get_temp_file_path
 from foundrytools_cli_2.cli.base_command import BaseCommand
 from foundrytools_cli_2.cli.logger import logger
 from foundrytools_cli_2.cli.otf.options import drop_hinting_data_flag, otf_autohint_options
-from foundrytools_cli_2.cli.shared_options import subroutinize_flag
+from foundrytools_cli_2.cli.shared_options import jobs_option, subroutinize_flag
 from foundrytools_cli_2.cli.task_runner import TaskRunner
 
 cli = click.Group(help="Utilities for editing OpenType-PS fonts.")
@@ -119,24 +119,12 @@ def check_outlines(input_path: Path, **options: dict[str, Any]) -> None:
 
 @cli.command("round-coordinates", cls=BaseCommand)
 @subroutinize_flag()
+@jobs_option()
 def round_coordinates(input_path: Path, **options: dict[str, Any]) -> None:
     """
     Round the coordinates of OpenType-PS fonts.
     """
-
-    def task(font: Font, subroutinize: bool = True, drop_hinting_data: bool = False) -> bool:
-        logger.info("Rounding coordinates")
-        result = font.t_cff_.round_coordinates(drop_hinting_data=drop_hinting_data)
-        if not result:
-            return False
-
-        logger.info(f"{len(result)} glyphs were modified")
-
-        if subroutinize:
-            logger.info("Subroutinizing")
-            font.subroutinize()
-
-        return True
+    from foundrytools_cli_2.cli.otf.tasks.round_coordinates import main as task
 
     runner = TaskRunner(input_path=input_path, task=task, **options)
     runner.filter.filter_out_tt = True
@@ -204,10 +192,11 @@ def recalc_stems(input_path: Path, **options: dict[str, Any]) -> None:
 
         logger.info("Getting stems...")
 
-        current_std_h_w = font.t_cff_.get_hinting_data().get("StdHW", None)
-        current_std_v_w = font.t_cff_.get_hinting_data().get("StdVW", None)
-        current_stem_snap_h = font.t_cff_.get_hinting_data().get("StemSnapH", None)
-        current_stem_snap_v = font.t_cff_.get_hinting_data().get("StemSnapV", None)
+        current_hinting_data = font.t_cff_.get_hinting_data()
+        current_std_h_w = current_hinting_data.get("StdHW", None)
+        current_std_v_w = current_hinting_data.get("StdVW", None)
+        current_stem_snap_h = current_hinting_data.get("StemSnapH", None)
+        current_stem_snap_v = current_hinting_data.get("StemSnapV", None)
 
         report_all_stems = cast(bool, options["report_all_stems"])
         max_distance = cast(int, options["max_distance"])
@@ -261,9 +250,10 @@ def recalc_zones(input_path: Path, **options: dict[str, Any]) -> None:
         if not font.is_ps:
             logger.error("Font is not a PostScript font")
             return False
+        current_hinting_data = font.t_cff_.get_hinting_data()
         current_other_blues, current_blues = (
-            font.t_cff_.get_hinting_data().get("OtherBlues", None),
-            font.t_cff_.get_hinting_data().get("BlueValues", None),
+            current_hinting_data.get("OtherBlues", None),
+            current_hinting_data.get("BlueValues", None),
         )
         other_blues, blue_values = get_zones(font)
         logger.info(f"BlueValues: {current_blues} -> {blue_values}")
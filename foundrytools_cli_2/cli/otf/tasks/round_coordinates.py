@@ -0,0 +1,31 @@
+from foundrytools import Font
+
+from foundrytools_cli_2.cli.logger import logger
+
+
+def main(font: Font, subroutinize: bool = True, drop_hinting_data: bool = False) -> bool:
+    """
+    Round the coordinates of the glyphs in the ``CFF`` table.
+
+    Args:
+        font (Font): The font to process.
+        subroutinize (bool, optional): Whether to subroutinize the font after rounding the
+            coordinates. Defaults to ``True``.
+        drop_hinting_data (bool, optional): Whether to drop the hinting data of the rounded glyphs.
+            Defaults to ``False``.
+
+    Returns:
+        bool: ``True`` if any glyph was modified, ``False`` otherwise.
+    """
+    logger.info("Rounding coordinates")
+    result = font.t_cff_.round_coordinates(drop_hinting_data=drop_hinting_data)
+    if not result:
+        return False
+
+    logger.info(f"{len(result)} glyphs were modified")
+
+    if subroutinize:
+        logger.info("Subroutinizing")
+        font.subroutinize()
+
+    return True
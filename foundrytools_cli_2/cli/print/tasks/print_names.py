@@ -7,10 +7,11 @@ from foundrytools.constants import (
     MAC_ENCODING_IDS,
     NAME_IDS_TO_DESCRIPTION,
     PLATFORMS,
+    T_CFF,
+    T_NAME,
     TERMINAL_WIDTH,
     WINDOWS_ENCODING_IDS,
 )
-from foundrytools.core.tables import CFFTable, NameTable
 from rich.console import Console
 from rich.table import Table
 
@@ -45,22 +46,28 @@ JUSTIFY = 22
 def _process_name_table(
     font: Font, table: Table, terminal_width: int, max_lines: t.Optional[int], minimal: bool
 ) -> None:
-    name_table = NameTable(font.ttfont)
-    names = name_table.table.names
+    # The table is only read, so there's no need to wrap (and deep copy) it in a NameTable
+    names = font.ttfont[T_NAME].names
     table.add_row(FONT_STYLE.format(name=font.file.name if font.file else font.bytesio))
     table.add_section()
     table.add_row(TABLE_NAME)
-    platforms = {(name.platformID, name.platEncID, name.langID) for name in names}
-    for platform in platforms:
+    # Group the records by platform in a single pass, instead of scanning all the records for each
+    # platform. Platforms are kept even if the minimal filter leaves them without records.
+    names_by_platform: t.Dict[t.Tuple[int, int, int], t.List[NameRecord]] = {}
+    for name in names:
+        platform_names = names_by_platform.setdefault(
+            (name.platformID, name.platEncID, name.langID), []
+        )
+        if not minimal or name.nameID in MINIMAL_NAME_IDS:
+            platform_names.append(name)
+
+    for platform, platform_names in names_by_platform.items():
         platform_row = _get_platform_row(platform)
         table.add_section()
         table.add_row(platform_row)
         table.add_section()
-        for name in names:
-            if (name.platformID, name.platEncID, name.langID) == platform:
-                if minimal and name.nameID not in MINIMAL_NAME_IDS:
-                    continue
-                _add_name_row_to_table(table, name, terminal_width, max_lines)
+        for name in platform_names:
+            _add_name_row_to_table(table, name, terminal_width, max_lines)
 
 
 def _add_name_row_to_table(
@@ -82,13 +89,13 @@ def _process_cff_table(
 ) -> None:
     if not font.is_ps:
         return
-    cff_table = CFFTable(font.ttfont)
+    cff = font.ttfont[T_CFF].cff
     cff_names = [
         {k: v}
-        for k, v in cff_table.top_dict.rawDict.items()
+        for k, v in cff.topDictIndex[0].rawDict.items()
         if k not in IGNORED_CFF_NAMES and (not minimal or k in MINIMAL_CFF_NAMES)
     ]
-    cff_names.insert(0, {"fontNames": cff_table.table.cff.fontNames})
+    cff_names.insert(0, {"fontNames": cff.fontNames})
     table.add_section()
     table.add_row(CFF_TABLE_NAME)
     table.add_section()
@@ -93,11 +93,16 @@ def tuple_to_set_callback(
     return set(value)
 
 
+# Parameters that don't set any attribute and are not taken into account by
+# ``ensure_at_least_one_param``
+NON_ATTRIBUTE_PARAMS = frozenset(
+    ["input_path", "output_dir", "recursive", "recalc_timestamp", "overwrite"]
+)
+
+
 def ensure_at_least_one_param(ctx: click.Context) -> None:
     """
     Checks if any attributes are provided to set, except for the ignored ones.
     """
-    ignored = ["input_path", "output_dir", "recursive", "recalc_timestamp", "overwrite"]
-
-    if all(value is None for key, value in ctx.params.items() if key not in ignored):
+    if all(value is None for key, value in ctx.params.items() if key not in NON_ATTRIBUTE_PARAMS):
         raise click.UsageError("No attributes provided to set.")
@@ -284,25 +284,6 @@ def correct_contours_flag() -> Callable:
     return add_options(_correct_contours_flag)
 
 
-def min_area_option() -> Callable:
-    """
-    Add the ``min_area`` option to a click command.
-
-    Returns:
-        t.Callable: A decorator that adds the ``min_area`` option to a click command
-    """
-    _min_area_option = [
-        click.option(
-            "-ma",
-            "--min-area",
-            type=click.IntRange(min=0),
-            default=25,
-            help="Remove tiny paths with area less than the specified value.",
-        )
-    ]
-    return add_options(_min_area_option)
-
-
 def old_string_option() -> Callable:
     """
     Add the ``old_string`` option to a click command.
@@ -343,3 +324,26 @@ def new_string_option() -> Callable:
         )
     ]
     return add_options(_new_string_option)
+
+
+def jobs_option() -> Callable:
+    """
+    Add the ``jobs`` option to a click command.
+
+    Returns:
+        t.Callable: A decorator that adds the ``jobs`` option to a click command
+    """
+    _jobs_option = [
+        click.option(
+            "-j",
+            "--jobs",
+            type=click.IntRange(min=1),
+            default=1,
+            show_default=True,
+            help="""
+            The number of fonts to process in parallel. Each font is processed in a separate
+            worker process. The number of processes is capped to the number of CPUs.
+            """,
+        )
+    ]
+    return add_options(_jobs_option)
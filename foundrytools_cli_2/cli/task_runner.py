@@ -1,5 +1,10 @@
+import itertools
+import os
+import pickle
+import sys
 import typing as t
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
 from pathlib import Path
 
 from foundrytools import Font
@@ -10,7 +15,7 @@ from foundrytools.lib.font_finder import (
     FontFinder,
 )
 
-from foundrytools_cli_2.cli.logger import logger
+from foundrytools_cli_2.cli.logger import init_worker_logger, logger, pop_worker_logs
 from foundrytools_cli_2.cli.timer import Timer
 
 
@@ -34,53 +39,84 @@ class SaveOptions:
     overwrite: bool = False
 
 
+@dataclass
+class RunnerOptions:
+    """
+    A class that specifies how the fonts are scheduled for processing.
+    """
+
+    jobs: int = 1
+
+
+# ProcessPoolExecutor raises a ValueError on Windows when max_workers is greater than 61
+_WINDOWS_MAX_WORKERS = 61
+
+# The option names are fixed when the classes are defined, so they are collected only once
+_FINDER_OPTIONS_KEYS = frozenset(f.name for f in fields(FinderOptions))
+_SAVE_OPTIONS_KEYS = frozenset(f.name for f in fields(SaveOptions))
+_RUNNER_OPTIONS_KEYS = frozenset(f.name for f in fields(RunnerOptions))
+_NON_TASK_OPTIONS_KEYS = _FINDER_OPTIONS_KEYS | _SAVE_OPTIONS_KEYS | _RUNNER_OPTIONS_KEYS
+
+
 class TaskRunnerConfig:  # pylint: disable=too-few-public-methods
     """
     Handle options for TaskRunner.
     """
 
+    __slots__ = (
+        "task",
+        "filter",
+        "finder_options",
+        "save_options",
+        "runner_options",
+        "task_options",
+    )
+
     def __init__(self, task_callable: t.Callable, options: t.Dict[str, t.Any]):
         self.task = task_callable
         self.filter = FinderFilter()
         self.finder_options = FinderOptions()
         self.save_options = SaveOptions()
+        self.runner_options = RunnerOptions()
         self.task_options: t.Dict[str, t.Any] = {}
         self._handle_options(options)
 
     def _handle_options(self, options: t.Dict[str, t.Any]) -> None:
         self._parse_finder_options(options)
         self._parse_save_options(options)
+        self._parse_runner_options(options)
         self._parse_task_options(options)
 
     def _parse_finder_options(self, options: t.Dict[str, t.Any]) -> None:
-        self._set_options(self.finder_options, options)
+        self._set_options(self.finder_options, options, keys=_FINDER_OPTIONS_KEYS)
 
     def _parse_save_options(self, options: t.Dict[str, t.Any]) -> None:
-        self._set_options(self.save_options, options)
+        self._set_options(self.save_options, options, keys=_SAVE_OPTIONS_KEYS)
+
+    def _parse_runner_options(self, options: t.Dict[str, t.Any]) -> None:
+        self._set_options(self.runner_options, options, keys=_RUNNER_OPTIONS_KEYS)
 
     def _parse_task_options(self, options: t.Dict[str, t.Any]) -> None:
-        if "kwargs" in t.get_type_hints(self.task):
-            self.task_options.update(
-                {
-                    k: v
-                    for k, v in options.items()
-                    if k not in t.get_type_hints(FinderOptions)
-                    and k not in t.get_type_hints(SaveOptions)
-                }
-            )
+        task_hints = t.get_type_hints(self.task)
+        accepts_kwargs = "kwargs" in task_hints
         for key, value in options.items():
-            if key in t.get_type_hints(self.task):
-                self.task_options.update({key: value})
+            if key in task_hints or (accepts_kwargs and key not in _NON_TASK_OPTIONS_KEYS):
+                self.task_options[key] = value
 
     @staticmethod
     def _set_options(
-        options_group: t.Union[dict, FinderOptions, SaveOptions], options: t.Dict[str, t.Any]
+        options_group: t.Union[FinderOptions, SaveOptions, RunnerOptions],
+        options: t.Dict[str, t.Any],
+        keys: t.FrozenSet[str],
     ) -> None:
         """
         Update attributes of an options_group with provided options if the attribute exists.
+
+        Only the fields of the options group, passed in ``keys``, are considered: methods and other
+        class attributes can't be overwritten by an option with the same name.
         """
         for key, value in options.items():
-            if hasattr(options_group, key):
+            if key in keys:
                 setattr(options_group, key, value)
 
 
@@ -98,9 +134,11 @@ class TaskRunner:  # pylint: disable=too-few-public-methods
             modified. Set to True when it's not possible to determine if the font has been modified,
             or when it's too expensive to check. Defaults to False.
         config (TaskRunnerConfig): A configuration object containing FinderOptions, SaveOptions,
-            and specific task options.
+            RunnerOptions and specific task options.
     """
 
+    __slots__ = ("input_path", "task", "filter", "save_if_modified", "force_modified", "config")
+
     def __init__(
         self,
         input_path: Path,
@@ -128,26 +166,151 @@ class TaskRunner:  # pylint: disable=too-few-public-methods
         Executes a task processing multiple fonts.
         """
         try:
-            fonts = self._find_fonts()
+            files = self._find_files()
+            fonts, multiple_fonts = self._load_fonts(files)
         except (FinderError, NoFontsFoundError) as e:
             logger.error(e)
             return
 
-        timer = Timer(
+        # A single font is processed in the main process, without starting a pool
+        if multiple_fonts and self._get_jobs() > 1 and self._can_run_in_parallel():
+            self._process_fonts_in_parallel(fonts)
+            return
+
+        timer = self._get_processing_timer()
+        for font in fonts:
+            self._process_font(font, timer=timer)
+            print()  # add a newline after each font
+
+    def _get_jobs(self) -> int:
+        """
+        Return the number of worker processes to use.
+
+        When output files must not be overwritten, each worker would look for a free output file
+        name on its own, and two workers could pick the same one and overwrite each other's file:
+        in that case the fonts are processed serially.
+        """
+        jobs = self.config.runner_options.jobs
+        if jobs > 1 and not self.config.save_options.overwrite:
+            logger.warning("Parallel processing is not supported with --no-overwrite, using 1 job")
+            return 1
+        return jobs
+
+    def _can_run_in_parallel(self) -> bool:
+        """
+        Check whether the runner can be sent to the worker processes. This is not the case when the
+        task is a closure or a lambda, which can't be pickled: in that case the fonts are processed
+        serially.
+        """
+        try:
+            pickle.dumps(self)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            logger.warning(
+                f"Task {getattr(self.task, '__qualname__', self.task)!r} can't be run in parallel, "
+                f"processing fonts serially"
+            )
+            return False
+        return True
+
+    def _process_fonts_in_parallel(self, fonts: t.Iterator[Font]) -> None:
+        """
+        Process the fonts in a pool of worker processes. The fonts are closed in the main process
+        and reopened from their files by the workers, so that only the file paths are sent across
+        process boundaries. The task must be a module-level callable, so that it can be pickled.
+
+        The messages logged by each worker are collected and printed by the main process in the
+        same order as the fonts, as soon as the font and all the fonts before it are processed.
+        """
+        files = []
+        for font in fonts:
+            if font.file is not None:
+                files.append(font.file)
+            font.close()
+
+        max_workers = min(self.config.runner_options.jobs, len(files), self._get_max_workers())
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=init_worker_logger
+        ) as executor:
+            for output in executor.map(self._process_file, files):
+                sys.stderr.write(output)
+                print()  # add a newline after each font
+
+    @staticmethod
+    def _get_max_workers() -> int:
+        """
+        Return the maximum number of worker processes: one per CPU, and no more than the platform
+        allows.
+        """
+        max_workers = os.cpu_count() or 1
+        if sys.platform == "win32":
+            max_workers = min(max_workers, _WINDOWS_MAX_WORKERS)
+        return max_workers
+
+    def _process_file(self, file: Path) -> str:
+        # The file may have been moved or changed after the fonts were searched: log the error
+        # instead of letting it stop the whole pool.
+        try:
+            font = self._open_font(file)
+        except Exception as e:  # pylint: disable=broad-except
+            self._log_error(e)
+        else:
+            self._process_font(font, timer=self._get_processing_timer())
+        return pop_worker_logs()
+
+    @staticmethod
+    def _get_processing_timer() -> Timer:
+        return Timer(
             logger=logger.opt(colors=True).info,
             text="Processing time: <cyan>{:0.4f} seconds</>",
         )
-        for font in fonts:
-            self._process_font(font, timer=timer)
 
-    def _find_fonts(self) -> t.List[Font]:
-        finder = FontFinder(
-            input_path=self.input_path, options=self.config.finder_options, filter_=self.filter
+    def _get_finder(self, input_path: Path) -> FontFinder:
+        return FontFinder(
+            input_path=input_path, options=self.config.finder_options, filter_=self.filter
         )
-        fonts = finder.find_fonts()
-        if not fonts:
+
+    def _find_files(self) -> t.List[Path]:
+        """
+        Return the files found in the input path. The list is collected before the first font is
+        processed, so that tasks that move, delete or save files in the input path don't change
+        which files are processed.
+        """
+        # The finder validates the input path and the filter, raising a FinderError if they are
+        # not valid.
+        input_path = self._get_finder(self.input_path).input_path
+        if input_path.is_file():
+            return [input_path]
+        pattern = "**/*" if self.config.finder_options.recursive else "*"
+        return [file for file in input_path.glob(pattern) if file.is_file()]
+
+    def _load_fonts(self, files: t.List[Path]) -> t.Tuple[t.Iterator[Font], bool]:
+        """
+        Return an iterator over the fonts loaded from the given files, filtered out with the
+        finder's filter, and whether more than one font was found. Fonts are loaded one at a time
+        while they are processed, instead of being all loaded upfront. The first two fonts are
+        looked up eagerly, so that a ``NoFontsFoundError`` can be raised before processing starts.
+        """
+        fonts = self._generate_fonts(files)
+        first_fonts = list(itertools.islice(fonts, 2))
+        if not first_fonts:
             raise NoFontsFoundError(f"No fonts found in {self.input_path}")
-        return fonts
+        return itertools.chain(first_fonts, fonts), len(first_fonts) > 1
+
+    def _generate_fonts(self, files: t.List[Path]) -> t.Iterator[Font]:
+        for file in files:
+            # Skip the files removed since the list was collected
+            if not file.is_file():
+                continue
+            yield from self._get_finder(file).generate_fonts()
+
+    def _open_font(self, file: Path) -> Font:
+        finder_options = self.config.finder_options
+        return Font(
+            file,
+            lazy=finder_options.lazy,
+            recalc_bboxes=finder_options.recalc_bboxes,
+            recalc_timestamp=finder_options.recalc_timestamp,
+        )
 
     def _process_font(self, font: Font, timer: Timer) -> None:
         with font:
@@ -156,7 +319,6 @@ class TaskRunner:  # pylint: disable=too-few-public-methods
             task_result = bool(self._execute_task(font))
             self._save_or_skip(font, task_status=task_result)
             timer.stop()
-            print()  # add a newline after each font
 
     def _execute_task(self, font: Font) -> bool:
         try:
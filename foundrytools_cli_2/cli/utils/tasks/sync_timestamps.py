@@ -28,15 +28,6 @@ if platform.system() == "Windows":
 __all__ = ["main"]
 
 
-# Helper function for Python 3.8 compatibility
-def _is_relative_to(path: Path, other: Path) -> bool:
-    try:
-        path.relative_to(other)
-        return True
-    except ValueError:
-        return False
-
-
 def _get_file_timestamps(
     input_path: Path, recursive: bool = True
 ) -> t.Dict[Path, t.Tuple[int, int]]:
@@ -57,25 +48,19 @@ def _get_folder_timestamps(
     folders: t.Set[Path],
     files_timestamps: t.Dict[Path, t.Tuple[int, int]],
 ) -> t.Dict[Path, t.Tuple[int, int]]:
-    folder_timestamps = {
-        folder: (
-            min(
-                files_timestamps[file][0]
-                for file in files_timestamps
-                if hasattr(file, "is_relative_to")
-                and file.is_relative_to(folder)
-                or _is_relative_to(file, folder)
-            ),
-            max(
-                files_timestamps[file][1]
-                for file in files_timestamps
-                if hasattr(file, "is_relative_to")
-                and file.is_relative_to(folder)
-                or _is_relative_to(file, folder)
-            ),
-        )
-        for folder in folders
-    }
+    # A folder gets the oldest created and the newest modified timestamps of all the files it
+    # contains, including the ones in its subfolders. Instead of scanning all the files for each
+    # folder, each file updates the folders among its own parents.
+    folder_timestamps: t.Dict[Path, t.Tuple[int, int]] = {}
+    for file, (created, modified) in files_timestamps.items():
+        for folder in file.parents:
+            if folder not in folders:
+                continue
+            folder_created, folder_modified = folder_timestamps.get(folder, (created, modified))
+            folder_timestamps[folder] = (
+                min(created, folder_created),
+                max(modified, folder_modified),
+            )
 
     return folder_timestamps
 